@@ -2,23 +2,43 @@ import json
 import os
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SEARCH_CACHE_SIZE = 256  # запросов в кэше search_apps
+
 class AppDatabase:
     def __init__(self):
         self.db_file = "app_database.json"
         self.apps = self.load_database()
+        self.invalidate_caches()
+        
+    def invalidate_caches(self):
+        """Сбрасывает производные данные после изменения базы"""
+        self._search_index = None
+        self._search_cache = {}
+        self._categories_cache = None
+        self._stats_cache = None
         
     def load_database(self) -> Dict:
         """Загружает базу данных приложений"""
         if os.path.exists(self.db_file):
             try:
-                with open(self.db_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.db_file, 'rb') as f:
+                    content = f.read()
+                return orjson.loads(content) if orjson is not None else json.loads(content)
             except:
                 return self.get_default_apps()
         return self.get_default_apps()
     
     def save_database(self):
         """Сохраняет базу данных"""
+        if orjson is not None:
+            with open(self.db_file, 'wb') as f:
+                f.write(orjson.dumps(self.apps, option=orjson.OPT_INDENT_2))
+            return
         with open(self.db_file, 'w', encoding='utf-8') as f:
             json.dump(self.apps, f, ensure_ascii=False, indent=2)
     
@@ -89,34 +109,55 @@ class AppDatabase:
     
     def get_all_categories(self) -> List[str]:
         """Получает все уникальные категории"""
-        return list(set(app.get("category") for app in self.apps.values()))
+        if self._categories_cache is None:
+            self._categories_cache = list(set(app.get("category") for app in self.apps.values()))
+        return self._categories_cache
+    
+    def get_search_index(self) -> List[tuple]:
+        """Строит (один раз) список (app_id, name, description, tags) в нижнем регистре для поиска"""
+        if self._search_index is None:
+            self._search_index = [
+                (
+                    app_id,
+                    app_data.get("name", "").lower(),
+                    app_data.get("description", "").lower(),
+                    " ".join(app_data.get("tags", [])).lower()
+                )
+                for app_id, app_data in self.apps.items()
+            ]
+        return self._search_index
     
     def search_apps(self, query: str) -> List[Dict]:
         """Поиск приложений по названию или описанию"""
-        results = []
         query_lower = query.lower()
-        
-        for app_id, app_data in self.apps.items():
-            if (query_lower in app_data.get("name", "").lower() or
-                query_lower in app_data.get("description", "").lower() or
-                query_lower in " ".join(app_data.get("tags", [])).lower()):
-                results.append({"id": app_id, **app_data})
-        
-        return results
+        if query_lower not in self._search_cache:
+            if len(self._search_cache) >= SEARCH_CACHE_SIZE:
+                self._search_cache.clear()
+            self._search_cache[query_lower] = [
+                {"id": app_id, **self.apps[app_id]}
+                for app_id, name, description, tags in self.get_search_index()
+                if query_lower in name or query_lower in description or query_lower in tags
+            ]
+        return self._search_cache[query_lower]
     
     def add_app(self, app_id: str, app_data: Dict):
         """Добавляет новое приложение в базу"""
         self.apps[app_id] = app_data
+        self.invalidate_caches()
         self.save_database()
     
     def update_app(self, app_id: str, app_data: Dict):
         """Обновляет информацию о приложении"""
         if app_id in self.apps:
             self.apps[app_id].update(app_data)
+            self.invalidate_caches()
             self.save_database()
     
     def get_app_statistics(self) -> Dict:
         """Получает статистику по приложениям"""
+        if self._stats_cache is not None:
+            return self._stats_cache
+        
         categories = {}
         platforms = {}
         
@@ -127,11 +168,12 @@ class AppDatabase:
             categories[category] = categories.get(category, 0) + 1
             platforms[platform] = platforms.get(platform, 0) + 1
         
-        return {
+        self._stats_cache = {
             "total_apps": len(self.apps),
             "categories": categories,
             "platforms": platforms
         }
+        return self._stats_cache
 
 # Глобальный экземпляр базы данных
 app_db = AppDatabase() 
\ No newline at end of file
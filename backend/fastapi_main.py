@@ -2,7 +2,7 @@
 FastAPI Backend for Moloco Dashboard v2
 Modern, fast, and scalable architecture
 """
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
@@ -16,17 +16,45 @@ from moloco_processor import MolocoCSVProcessor
 from app_database import app_db
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
-import hashlib
+import time
+import threading
+import gzip
+import bisect
+import inspect
+from typing import Optional
+from urllib.parse import urlsplit, parse_qsl
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class ReportJSONResponse(JSONResponse):
+    """JSONResponse rendered through dump_report_json (orjson when installed)"""
+    def render(self, content) -> bytes:
+        return dump_report_json(content)
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Moloco Dashboard API",
     description="API for processing Moloco CSV files and generating analytics",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ReportJSONResponse
 )
 
-# Add compression middleware for better performance
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Add compression middleware for better performance. Bodies under ~1.5 KB (health check,
+# delete confirmations, single apps) are not worth the CPU and latency; level 4 keeps
+# per-request compression cheap, while the memoized /reports body is compressed once at 6
+GZIP_MINIMUM_SIZE = 1500
+GZIP_LEVEL = 4
+CACHED_GZIP_LEVEL = 6
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=GZIP_LEVEL)
 
 # Add CORS middleware
 app.add_middleware(
@@ -49,20 +77,469 @@ app.add_middleware(
 
 # Configuration
 UPLOAD_FOLDER = "uploads"
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+REPORTS_INDEX_PATH = os.path.join(UPLOAD_FOLDER, "index.json")
+AGGREGATED_SNAPSHOT_PATH = os.path.join(UPLOAD_FOLDER, "aggregated.json")
+# The snapshot's fingerprint on its own, so a cache miss can reject a stale snapshot cheaply
+AGGREGATED_FINGERPRINT_PATH = os.path.join(UPLOAD_FOLDER, "aggregated.fingerprint.json")
+# Bump whenever the aggregated data's shape changes, so snapshots from older code are rebuilt
+AGGREGATED_SNAPSHOT_VERSION = 1
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 # In-memory storage for processed reports (in production, use database)
 processed_reports = []
+reports_by_id = {}  # same report dicts, keyed by id
+last_report_id = 0  # highest id handed out or loaded so far
+
+# Running totals for /analytics/overview, maintained by add_report/discard_report
+reports_totals = {
+    'spend': 0,
+    'accounts': {},  # account -> number of reports
+    'latest_upload': None
+}
+
+# Aggregation section of each csv_type, and the newest report per section (by upload_time)
+REPORT_SECTIONS = {
+    'reports': 'reports',
+    'report': 'reports',
+    'inventory_overall': 'overall',
+    'inventory_daily': 'daily'
+}
+latest_reports_by_section = {}
+
+# Bumped on every change to processed_reports; the aggregated cache key.
+# Cache keys here are plain counters/tuples; nothing in this module needs hashing
+reports_version = 0
 
 # Cache for aggregated data to improve performance
 aggregated_data_cache = {
     'data': None,
-    'hash': None,
-    'timestamp': None
+    'key': None,
+    'fingerprint': None,  # report files and mtimes the data was built from
+    'timestamp': None  # time.monotonic() of the last rebuild
+}
+AGGREGATED_CACHE_TTL = 30  # seconds between mtime revalidations
+
+# Encoded (and gzipped) /reports body, reused while the aggregated data is unchanged
+reports_response_cache = {
+    'source': None,  # the aggregated data dict the body was built from
+    'version': None,  # reports_version at that time (report metadata in the body)
+    'body': None,
+    'gzip': None
+}
+
+# Sorted copies of the current creatives list per (sort_by, reverse); reset when the list changes
+sorted_creatives_cache = {
+    'source': None,
+    'orders': {}
 }
 
-# Thread pool for CPU-intensive operations
-executor = ThreadPoolExecutor(max_workers=2)
+# /reports/filtered results per (start day, end day, country) for the current aggregate
+filtered_reports_cache = {
+    'source': None,
+    'results': {}
+}
+FILTERED_CACHE_MAX_ENTRIES = 64
+
+# Sorted union of the per-report 'dates'/'countries' summaries for the current reports_version
+report_values_cache = {
+    'version': None,
+    'values': {}
+}
+
+# Parsed processed reports: (report_path, tables) -> ((mtime_ns, size), data), least recently
+# used first. Only the aggregation's repeated reads go through it; one-off reads bypass it
+report_data_cache = {}
+REPORT_DATA_CACHE_MAX_ENTRIES = 16
+
+# daily_breakdown rows of each inventory_daily report, keyed by report_path
+daily_breakdown_rows = {}
+# Same rows sorted by date with a parallel list of their dates, for bisect range queries
+daily_breakdown_sorted = {}
+
+# Thread pool for CPU-intensive operations (CSV parsing/processing runs here, off the event loop)
+executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+# Separate small pool for prefetch_daily_breakdowns: it is waited on from the event loop, so it
+# must never queue behind uploads on the shared executor
+PREFETCH_WORKERS = 4
+prefetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix='prefetch')
+
+# Record tables of a processed report mirrored as parquet sidecars: name -> location in the JSON
+REPORT_TABLES = {
+    'top_campaigns': ('top_campaigns',),
+    'top_performers': ('creative_performance', 'top_performers'),
+    'exchange_performance': ('exchange_performance',),
+    'geographic_performance': ('geographic_performance',),
+    'daily_breakdown': ('daily_breakdown',),
+    'apps': ('inventory_app_analysis', 'apps'),
+}
+
+def report_sidecar_paths(report_path: str) -> dict:
+    """Paths of the meta JSON and parquet sidecars that belong to a processed report"""
+    base = report_path[:-len('.json')]
+    paths = {table: f"{base}.{table}.parquet" for table in REPORT_TABLES}
+    paths['meta'] = f"{base}.meta.json"
+    return paths
+
+# Parquet schema metadata key listing the columns stored as JSON text
+SIDECAR_JSON_COLUMNS_KEY = b'json_columns'
+
+def records_to_table(records: list):
+    """pa.Table of record dicts; columns mixing value types are stored as JSON text
+    
+    sanitize_frame fills NaN with 0 in every column, so a string column such as an app's
+    category can hold both str and int values, which pyarrow cannot type. Those columns are
+    listed in the schema metadata so table_to_records restores the original values.
+    """
+    names = dict.fromkeys(key for record in records for key in record)
+    json_columns = [
+        name for name in names
+        if len({type(record[name]) for record in records if record.get(name) is not None}) > 1
+    ]
+    if not json_columns:
+        return pa.Table.from_pylist(records)
+    records = [
+        {**record, **{name: dump_report_json(record[name]).decode('utf-8') for name in json_columns if name in record}}
+        for record in records
+    ]
+    table = pa.Table.from_pylist(records)
+    return table.replace_schema_metadata({SIDECAR_JSON_COLUMNS_KEY: dump_report_json(json_columns)})
+
+def table_to_records(table) -> list:
+    """Record dicts of a table written by records_to_table"""
+    rows = table.to_pylist()
+    metadata = table.schema.metadata or {}
+    if SIDECAR_JSON_COLUMNS_KEY in metadata:
+        json_columns = load_report_json(metadata[SIDECAR_JSON_COLUMNS_KEY])
+        for row in rows:
+            for name in json_columns:
+                if row.get(name) is not None:
+                    row[name] = load_report_json(row[name])
+    return rows
+
+def save_report_sidecars(report_path: str, stored_data: dict):
+    """Persist record tables as parquet and the small remaining sections as meta JSON
+    
+    stored_data must be the JSON-decoded report so sidecars hold exactly what the JSON file holds.
+    Tables pyarrow still cannot type stay inside the meta JSON.
+    """
+    if pq is None:
+        return
+    paths = report_sidecar_paths(report_path)
+    meta = {key: dict(value) if isinstance(value, dict) else value for key, value in stored_data.items()}
+    
+    for table, (section, *sub) in REPORT_TABLES.items():
+        container = meta.get(section) if sub else meta
+        key = sub[0] if sub else section
+        if not isinstance(container, dict) or not isinstance(container.get(key), list) or not container[key]:
+            continue
+        try:
+            pq.write_table(records_to_table(container[key]), paths[table])
+            del container[key]
+        except (pa.ArrowException, TypeError, ValueError) as e:
+            print(f"⚠️ Keeping {table} in meta JSON: {e}")
+    
+    # Written last: its presence marks the sidecar set as complete
+    with open(paths['meta'], 'wb') as f:
+        f.write(dump_report_json(meta))
+
+def read_processed_report(report_path: str, tables=None) -> dict:
+    """Read a processed report, reading only the requested parquet tables when sidecars exist"""
+    paths = report_sidecar_paths(report_path)
+    if pq is None or not os.path.exists(paths['meta']):
+        with open(report_path, 'rb') as f:
+            return load_report_json(f.read())
+    
+    with open(paths['meta'], 'rb') as f:
+        data = load_report_json(f.read())
+    for table in (REPORT_TABLES if tables is None else tables):
+        if not os.path.exists(paths[table]):
+            continue
+        rows = table_to_records(pq.read_table(paths[table], memory_map=True))
+        section, *sub = REPORT_TABLES[table]
+        if sub:
+            data.setdefault(section, {})[sub[0]] = rows
+        else:
+            data[section] = rows
+    return data
+
+def load_processed_report(report_path: str, tables=None) -> dict:
+    """read_processed_report with an in-memory cache keyed by path and table projection
+    
+    Entries are revalidated against the file's st_mtime_ns and size, so a rewrite within
+    the same mtime tick is still picked up. The returned dict is shared between callers
+    and must not be modified. Call on the event loop thread.
+    """
+    key = (report_path, None if tables is None else tuple(tables))
+    st = os.stat(report_path)
+    version = (st.st_mtime_ns, st.st_size)
+    cached = report_data_cache.pop(key, None)
+    if cached is not None and cached[0] == version:
+        report_data_cache[key] = cached  # move to the most recently used end
+        return cached[1]
+    data = read_processed_report(report_path, tables)
+    report_data_cache[key] = (version, data)
+    while len(report_data_cache) > REPORT_DATA_CACHE_MAX_ENTRIES:
+        del report_data_cache[next(iter(report_data_cache))]
+    return data
+
+def evict_report_caches(report_path: str):
+    """Drop a report's parsed data from the in-memory caches; call on the event loop thread"""
+    for key in [key for key in report_data_cache if key[0] == report_path]:
+        del report_data_cache[key]
+    daily_breakdown_rows.pop(report_path, None)
+    daily_breakdown_sorted.pop(report_path, None)
+
+def remove_report_files(report_path: str):
+    """Delete a processed report JSON together with its sidecars; touches no shared state,
+    so it can run on the executor"""
+    for path in [report_path, *report_sidecar_paths(report_path).values()]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+def delete_upload_files(report_files: list, csv_files: list):
+    """Delete processed reports (with sidecars) and uploaded CSVs; runs on the executor
+    
+    The caller clears the in-memory report caches on the event loop first.
+    """
+    for file_path in report_files:
+        remove_report_files(str(file_path))
+        print(f"🗑️ Deleted: {file_path}")
+    for file_path in csv_files:
+        file_path.unlink(missing_ok=True)
+        print(f"🗑️ Deleted: {file_path}")
+
+def get_daily_breakdown(report_path: str) -> list:
+    """Return a daily report's breakdown rows, reading them from disk only once"""
+    if report_path not in daily_breakdown_rows:
+        # daily_breakdown_rows is the cache here; may run on prefetch_executor
+        daily_data = read_processed_report(report_path, ('daily_breakdown',))
+        daily_breakdown_rows[report_path] = daily_data.get('daily_breakdown', [])
+    return daily_breakdown_rows[report_path]
+
+def prefetch_daily_breakdowns(report_paths: list):
+    """Read the not yet cached daily breakdowns on prefetch_executor so their file reads overlap
+    
+    Failures are left for the caller's get_daily_breakdown pass to report.
+    """
+    pending = [path for path in report_paths if path not in daily_breakdown_rows]
+    if len(pending) < 2:
+        return
+    
+    def load(path):
+        try:
+            get_daily_breakdown(path)
+        except Exception:
+            pass
+    
+    list(prefetch_executor.map(load, pending))
+
+def get_daily_breakdown_sorted(report_path: str) -> tuple:
+    """(dates, rows) of a daily report with rows sorted by date; built once per report"""
+    if report_path not in daily_breakdown_sorted:
+        rows = sorted(get_daily_breakdown(report_path), key=lambda day: day.get('date', ''))
+        daily_breakdown_sorted[report_path] = ([day.get('date', '') for day in rows], rows)
+    return daily_breakdown_sorted[report_path]
+
+def dump_report_json(data: dict) -> bytes:
+    """Serialize a processed report compactly; orjson encodes numpy scalars natively"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+
+def load_report_json(content: bytes) -> dict:
+    """Parse a processed report produced by dump_report_json"""
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+def add_report(report_info: dict):
+    """Register a processed report in both the ordered list and the id lookup"""
+    global last_report_id
+    processed_reports.append(report_info)
+    last_report_id = max(last_report_id, report_info['id'])
+    reports_by_id[report_info['id']] = report_info
+    
+    reports_totals['spend'] += report_info.get('spend', 0)
+    accounts = reports_totals['accounts']
+    accounts[report_info['account']] = accounts.get(report_info['account'], 0) + 1
+    if reports_totals['latest_upload'] is None or report_info['upload_time'] > reports_totals['latest_upload']:
+        reports_totals['latest_upload'] = report_info['upload_time']
+    
+    section = REPORT_SECTIONS.get(report_info.get('csv_type', 'unknown'))
+    latest = latest_reports_by_section.get(section)
+    if section and (latest is None or report_info.get('upload_time', '') > latest.get('upload_time', '')):
+        latest_reports_by_section[section] = report_info
+
+def discard_report(report_id: int) -> Optional[dict]:
+    """Unregister a report by id; returns it, or None if unknown"""
+    report_info = reports_by_id.pop(report_id, None)
+    if report_info is None:
+        return None
+    processed_reports.remove(report_info)
+    
+    reports_totals['spend'] -= report_info.get('spend', 0)
+    accounts = reports_totals['accounts']
+    accounts[report_info['account']] -= 1
+    if not accounts[report_info['account']]:
+        del accounts[report_info['account']]
+    # Only deleting the newest report needs a rescan
+    if report_info['upload_time'] == reports_totals['latest_upload']:
+        reports_totals['latest_upload'] = max((r['upload_time'] for r in processed_reports), default=None)
+    section = REPORT_SECTIONS.get(report_info.get('csv_type', 'unknown'))
+    if latest_reports_by_section.get(section) is report_info:
+        del latest_reports_by_section[section]
+        for report in processed_reports:
+            latest = latest_reports_by_section.get(section)
+            if REPORT_SECTIONS.get(report.get('csv_type', 'unknown')) == section and (
+                    latest is None or report.get('upload_time', '') > latest.get('upload_time', '')):
+                latest_reports_by_section[section] = report
+    return report_info
+
+def clear_report_registry():
+    """Unregister every report"""
+    processed_reports.clear()
+    reports_by_id.clear()
+    reports_totals.update(spend=0, accounts={}, latest_upload=None)
+    latest_reports_by_section.clear()
+
+def next_report_id() -> int:
+    """Ids are never reused, even after the newest report is deleted"""
+    return last_report_id + 1
+
+def save_reports_index():
+    """Rewrite the processed_reports index so startup does not open every report
+    
+    last_report_id is stored alongside, so ids of deleted reports stay retired across restarts.
+    """
+    try:
+        with open(REPORTS_INDEX_PATH, 'wb') as f:
+            f.write(dump_report_json({'last_report_id': last_report_id, 'reports': processed_reports}))
+    except OSError as e:
+        print(f"⚠️ Could not write reports index: {e}")
+
+def load_reports_index() -> bool:
+    """Restore processed_reports from the index file; False if it is missing or corrupted"""
+    global last_report_id
+    try:
+        with open(REPORTS_INDEX_PATH, 'rb') as f:
+            index = load_report_json(f.read())
+    except (OSError, ValueError):
+        return False
+    # Indexes written before last_report_id was stored are a bare list of reports
+    if isinstance(index, list):
+        index = {'last_report_id': 0, 'reports': index}
+    if not isinstance(index, dict) or not isinstance(index.get('last_report_id'), int):
+        return False
+    reports = index.get('reports')
+    if not isinstance(reports, list) or not all(isinstance(r, dict) and 'report_path' in r for r in reports):
+        return False
+    for report in reports:
+        if os.path.exists(report['report_path']):
+            add_report(report)
+    last_report_id = max(last_report_id, index['last_report_id'])
+    return True
+
+def reports_fingerprint() -> list:
+    """[report_path, mtime] per processed report; changes whenever a report file is replaced"""
+    return [
+        [r['report_path'], os.path.getmtime(r['report_path']) if os.path.exists(r['report_path']) else None]
+        for r in processed_reports
+    ]
+
+def write_file_atomic(path: str, content: bytes):
+    """Write through a per-thread temp file and rename, so readers never see a partial file"""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+def remove_aggregated_snapshot():
+    """Delete the snapshot, fingerprint file first so it never vouches for a missing snapshot"""
+    for path in (AGGREGATED_FINGERPRINT_PATH, AGGREGATED_SNAPSHOT_PATH):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+def save_aggregated_snapshot(fingerprint: list, data: dict):
+    """Persist the aggregated data so a restarted worker can skip re-reading every report
+    
+    Runs on the executor. The fingerprint file is dropped before the snapshot is replaced and
+    written after it, so it only ever matches a complete snapshot.
+    """
+    try:
+        remove_aggregated_snapshot()
+        key = {'version': AGGREGATED_SNAPSHOT_VERSION, 'fingerprint': fingerprint}
+        write_file_atomic(AGGREGATED_SNAPSHOT_PATH, dump_report_json({**key, 'data': data}))
+        write_file_atomic(AGGREGATED_FINGERPRINT_PATH, dump_report_json(key))
+    except OSError as e:
+        print(f"⚠️ Could not write aggregated snapshot: {e}")
+
+def load_aggregated_snapshot(fingerprint: list):
+    """Return the persisted aggregated data if this code version built it from exactly these reports
+    
+    Only the small fingerprint file is read unless it matches.
+    """
+    key = {'version': AGGREGATED_SNAPSHOT_VERSION, 'fingerprint': fingerprint}
+    try:
+        with open(AGGREGATED_FINGERPRINT_PATH, 'rb') as f:
+            if load_report_json(f.read()) != key:
+                return None
+        with open(AGGREGATED_SNAPSHOT_PATH, 'rb') as f:
+            snapshot = load_report_json(f.read())
+    except (OSError, ValueError):
+        return None
+    # Checked again: the snapshot may have been replaced since the fingerprint was read
+    if (not isinstance(snapshot, dict) or snapshot.get('version') != AGGREGATED_SNAPSHOT_VERSION or
+            snapshot.get('fingerprint') != fingerprint):
+        return None
+    return snapshot.get('data')
+
+def summarize_report(data: dict) -> dict:
+    """Dates and countries a processed report covers, stored on its report_info"""
+    return {
+        'dates': sorted({day['date'] for day in data.get('daily_breakdown', []) if 'date' in day}),
+        'countries': sorted({geo['country'] for geo in data.get('geographic_performance', []) if 'country' in geo})
+    }
+
+def ensure_report_summary(report: dict):
+    """Fill in dates/countries for reports indexed before summaries were stored"""
+    if 'dates' not in report or 'countries' not in report:
+        report.update(summarize_report(
+            read_processed_report(report['report_path'], ('daily_breakdown', 'geographic_performance'))
+        ))
+
+def available_report_values(field: str) -> list:
+    """Sorted union of a per-report summary list ('dates' or 'countries') across all reports
+    
+    Memoized until reports_version changes; a pass with unreadable reports is not cached.
+    """
+    if report_values_cache['version'] != reports_version:
+        report_values_cache['version'] = reports_version
+        report_values_cache['values'] = {}
+    if field in report_values_cache['values']:
+        return report_values_cache['values'][field]
+    
+    values = set()
+    complete = True
+    for report in processed_reports:
+        try:
+            ensure_report_summary(report)
+            values.update(report[field])
+        except Exception as e:
+            print(f"❌ Error reading {field} from {report['filename']}: {e}")
+            complete = False
+    result = sorted(values)
+    if complete:
+        report_values_cache['values'][field] = result
+    return result
+
+def dates_in_range(dates: list, start_date: str = None, end_date: str = None) -> bool:
+    """Whether a sorted list of YYYY-MM-DD dates has any date within [start_date, end_date]"""
+    lo = bisect.bisect_left(dates, start_date) if start_date else 0
+    hi = bisect.bisect_right(dates, end_date) if end_date else len(dates)
+    return lo < hi
 
 def load_existing_reports():
     """Load existing processed reports from uploads directory"""
@@ -71,7 +548,26 @@ def load_existing_reports():
     if not uploads_dir.exists():
         return
     
-    for json_file in uploads_dir.glob("*_processed.json"):
+    json_files = list(uploads_dir.glob("*_processed.json"))
+    if load_reports_index():
+        # A report written but not yet indexed (e.g. a crash in between) is still on disk;
+        # only the directory listing is compared, no report is opened
+        indexed_paths = {r['report_path'] for r in processed_reports}
+        json_files = [f for f in json_files if str(f) not in indexed_paths]
+        if not json_files:
+            return
+        print(f"🔄 {len(json_files)} processed report(s) missing from the index, loading them")
+    
+    # No usable index (or unindexed files): read those processed JSON files and write a fresh index.
+    # The metas are read in parallel; reports are still registered in glob order
+    
+    def read_meta(json_file):
+        try:
+            return read_processed_report(str(json_file), ())
+        except Exception as e:
+            return e
+    
+    for json_file, data in zip(json_files, executor.map(read_meta, json_files)):
         try:
             # Extract info from filename
             filename_parts = json_file.stem.split('_')
@@ -79,24 +575,24 @@ def load_existing_reports():
                 account = filename_parts[0]
                 upload_time = f"{filename_parts[1]}_{filename_parts[2]}"
                 
-            # Load the JSON to get csv_type
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-                csv_type = data.get('csv_type', 'unknown')
-                
-                # If csv_type is unknown, try to detect from filename
-                if csv_type == 'unknown':
-                    filename = json_file.name.lower()
-                    if 'inventory_overall' in filename:
-                        csv_type = 'inventory_overall'
-                    elif 'inventory_daily' in filename:
-                        csv_type = 'inventory_daily'
-                    elif 'report' in filename and 'inventory' not in filename:
-                        csv_type = 'reports'
-                
+            # The report meta (no record tables) gives csv_type
+            if isinstance(data, Exception):
+                raise data
+            csv_type = data.get('csv_type', 'unknown')
+            
+            # If csv_type is unknown, try to detect from filename
+            if csv_type == 'unknown':
+                filename = json_file.name.lower()
+                if 'inventory_overall' in filename:
+                    csv_type = 'inventory_overall'
+                elif 'inventory_daily' in filename:
+                    csv_type = 'inventory_daily'
+                elif 'report' in filename and 'inventory' not in filename:
+                    csv_type = 'reports'
+            
             # Create report info
             report_info = {
-                'id': len(processed_reports) + 1,
+                'id': next_report_id(),
                 'account': account,
                 'filename': str(json_file.name).replace('_processed.json', '.csv'),
                 'upload_time': upload_time,
@@ -106,11 +602,12 @@ def load_existing_reports():
                 'columns': list(data.get('columns', {}).keys()) if isinstance(data.get('columns'), dict) else []
             }
             
-            processed_reports.append(report_info)
+            add_report(report_info)
             print(f"✅ Loaded existing report: {csv_type} - {json_file.name}")
             
         except Exception as e:
             print(f"❌ Error loading {json_file}: {e}")
+    save_reports_index()
 
 # Load existing reports on startup
 load_existing_reports()
@@ -138,6 +635,7 @@ async def upload_csv(
     - **account**: Account name (e.g., "Баер Вова", "Баер Артем")
     - **fileType**: Type of file (reports, inventory_overall, inventory_daily, auto)
     """
+    global reports_version
     
     # Validate file type
     if not file.filename or not file.filename.lower().endswith('.csv'):
@@ -149,14 +647,15 @@ async def upload_csv(
         safe_filename = f"{account}_{timestamp}_{file.filename}"
         filepath = os.path.join(UPLOAD_FOLDER, safe_filename)
         
-        # Save uploaded file
+        # Stream uploaded file to disk so only one chunk sits in memory at a time
         async with aiofiles.open(filepath, 'wb') as f:
-            content = await file.read()
-            await f.write(content)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await f.write(chunk)
         
-        # Process CSV
+        # Process CSV in the thread pool so concurrent uploads and requests are not blocked
+        loop = asyncio.get_running_loop()
         processor = MolocoCSVProcessor()
-        detection_result = processor.load_and_detect_type(filepath)
+        detection_result = await loop.run_in_executor(executor, processor.load_and_detect_type, filepath)
         
         if not detection_result['success']:
             raise HTTPException(status_code=400, detail=detection_result.get('error', 'Failed to process CSV'))
@@ -169,31 +668,39 @@ async def upload_csv(
         
         # Process data with filename for daily breakdown
         if processor.csv_type == 'inventory_daily':
-            processed_data = processor.process_inventory_csv(file.filename)
+            processed_data = await loop.run_in_executor(executor, processor.process_inventory_csv, file.filename)
         else:
-            processed_data = processor.process_data()
+            processed_data = await loop.run_in_executor(executor, processor.process_data)
         
         # Save processed data
         report_filename = safe_filename.replace('.csv', '_processed.json')
         report_path = os.path.join(UPLOAD_FOLDER, report_filename)
         
-        async with aiofiles.open(report_path, 'w') as f:
-            await f.write(json.dumps(processed_data, ensure_ascii=False, indent=2, default=str))
+        content = await loop.run_in_executor(executor, dump_report_json, processed_data)
+        async with aiofiles.open(report_path, 'wb') as f:
+            await f.write(content)
+        stored_data = load_report_json(content)
+        await loop.run_in_executor(executor, save_report_sidecars, report_path, stored_data)
+        if processor.csv_type == 'inventory_daily':
+            daily_breakdown_rows[report_path] = stored_data.get('daily_breakdown', [])
         
         # Create report info
         report_info = {
-            'id': len(processed_reports) + 1,
+            'id': next_report_id(),
             'account': account,
             'filename': file.filename,
             'upload_time': datetime.now().isoformat(),
             'report_path': report_path,
             'csv_type': processor.csv_type,
             'rows': detection_result.get('rows', 0),
-            'columns': detection_result.get('columns', [])
+            'columns': detection_result.get('columns', []),
+            **summarize_report(stored_data)
         }
         
         # Store report info
-        processed_reports.append(report_info)
+        add_report(report_info)
+        reports_version += 1
+        save_reports_index()
         
         return {
             "success": True,
@@ -207,12 +714,24 @@ async def upload_csv(
         print(f"❌ Error processing file: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
 
-@app.get("/reports")
-async def get_reports():
-    """Get list of all processed reports with aggregated data"""
-    # Get aggregated data from all reports
-    aggregated_data = aggregate_all_reports_data()
-    
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip (q > 0; an explicit gzip entry beats '*')"""
+    quality = {}
+    for item in accept_encoding.split(','):
+        name, *params = [part.strip() for part in item.split(';')]
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        quality[name.lower()] = q
+    return quality.get('gzip', quality.get('*', 0.0)) > 0
+
+def build_reports_payload(aggregated_data: dict) -> dict:
+    """Body of /reports: recent report metadata plus the aggregated data"""
     # Optimize response size by limiting reports metadata
     limited_reports = processed_reports[-10:] if len(processed_reports) > 10 else processed_reports
     
@@ -223,31 +742,67 @@ async def get_reports():
         **aggregated_data  # Add all aggregated data to response
     }
 
+@app.get("/reports")
+async def get_reports(request: Request):
+    """Get list of all processed reports with aggregated data"""
+    # Get aggregated data from all reports
+    aggregated_data = aggregate_all_reports_data()
+    
+    # Dashboards poll this endpoint; encode and compress only when the aggregate changes
+    if (reports_response_cache['source'] is not aggregated_data or
+            reports_response_cache['version'] != reports_version):
+        reports_response_cache['body'] = dump_report_json(build_reports_payload(aggregated_data))
+        reports_response_cache['gzip'] = None
+        reports_response_cache['source'] = aggregated_data
+        reports_response_cache['version'] = reports_version
+    
+    body = reports_response_cache['body']
+    if len(body) >= GZIP_MINIMUM_SIZE and accepts_gzip(request.headers.get('accept-encoding', '')):
+        if reports_response_cache['gzip'] is None:
+            reports_response_cache['gzip'] = gzip.compress(body, compresslevel=CACHED_GZIP_LEVEL)
+        return Response(
+            content=reports_response_cache['gzip'],
+            media_type='application/json',
+            headers={'Content-Encoding': 'gzip', 'Vary': 'Accept-Encoding'}
+        )
+    # GZipMiddleware only looks for 'gzip' in Accept-Encoding (it ignores q=0); an explicit
+    # identity encoding keeps it from compressing a body the client declined
+    return Response(
+        content=body,
+        media_type='application/json',
+        headers={'Content-Encoding': 'identity', 'Vary': 'Accept-Encoding'}
+    )
+
 @app.delete("/clear-reports")
 async def clear_reports():
     """Clear all processed reports from memory and delete files"""
-    global processed_reports
+    global processed_reports, reports_version
     
     try:
-        # Удаляем все файлы из папки uploads
+        # Файлы из папки uploads: список берём сейчас, чтобы не задеть загрузки,
+        # пришедшие во время удаления
         uploads_dir = Path("uploads")
-        if uploads_dir.exists():
-            for file_path in uploads_dir.glob("*_processed.json"):
-                file_path.unlink()
-                print(f"🗑️ Deleted: {file_path}")
-            
-            for file_path in uploads_dir.glob("*.csv"):
-                file_path.unlink()
-                print(f"🗑️ Deleted: {file_path}")
+        report_files = list(uploads_dir.glob("*_processed.json")) if uploads_dir.exists() else []
+        csv_files = list(uploads_dir.glob("*.csv")) if uploads_dir.exists() else []
         
         # Очищаем память
-        processed_reports.clear()
+        clear_report_registry()
+        daily_breakdown_rows.clear()
+        daily_breakdown_sorted.clear()
+        report_data_cache.clear()
+        reports_version += 1
+        save_reports_index()
+        remove_aggregated_snapshot()
         
         # Очищаем кэш
         aggregated_data_cache['data'] = None
-        aggregated_data_cache['hash'] = None
+        aggregated_data_cache['key'] = None
+        aggregated_data_cache['fingerprint'] = None
         aggregated_data_cache['timestamp'] = None
         
+        # Удаляем файлы вне event loop
+        await asyncio.get_running_loop().run_in_executor(executor, delete_upload_files, report_files, csv_files)
+        
         print(f"✅ Cleared all reports from memory, disk, and cache")
         
         return {
@@ -272,20 +827,14 @@ async def get_report_data(report_id: int):
     """
     
     # Find report
-    report = None
-    for r in processed_reports:
-        if r['id'] == report_id:
-            report = r
-            break
-    
+    report = reports_by_id.get(report_id)
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
     
     try:
-        # Load processed data
-        async with aiofiles.open(report['report_path'], 'r') as f:
-            content = await f.read()
-            data = json.loads(content)
+        # The response is built from the aggregate; only make sure the report is still on disk
+        if not os.path.exists(report['report_path']):
+            raise FileNotFoundError(report['report_path'])
         
         # Aggregate data from all reports
         aggregated_data = aggregate_all_reports_data()
@@ -315,35 +864,33 @@ def aggregate_all_reports_data():
             'inventory_app_analysis': {'apps': [], 'categories': [], 'total_apps': 0}
         }
     
-    # Create hash of processed reports for cache validation
-    reports_hash = hashlib.md5(str(len(processed_reports)).encode()).hexdigest()
-    current_time = datetime.now()
+    # reports_version changes on every upload/delete/clear, so it alone identifies the report set
+    cache_key = reports_version
+    current_time = time.monotonic()
     
     # Check if we have valid cached data (less than 30 seconds old)
     if (aggregated_data_cache['data'] is not None and 
-        aggregated_data_cache['hash'] == reports_hash and
-        aggregated_data_cache['timestamp'] and
-        (current_time - aggregated_data_cache['timestamp']).seconds < 30):
-        print("🚀 Using cached aggregated data")
+        aggregated_data_cache['key'] == cache_key and
+        current_time - aggregated_data_cache['timestamp'] < AGGREGATED_CACHE_TTL):
         return aggregated_data_cache['data']
     
-    # Get latest reports of each type (by upload_time)
-    latest_reports = {}
-    latest_inventory = {}
+    # Past the TTL only a changed report file (mtime) forces a rebuild
+    fingerprint = reports_fingerprint()
+    if aggregated_data_cache['data'] is not None and aggregated_data_cache['key'] == cache_key:
+        if aggregated_data_cache['fingerprint'] == fingerprint:
+            aggregated_data_cache['timestamp'] = current_time
+            return aggregated_data_cache['data']
     
-    for report in processed_reports:
-        csv_type = report.get('csv_type', 'unknown')
-        upload_time = report.get('upload_time', '')
-        
-        if csv_type in ('reports', 'report'):
-            if 'reports' not in latest_reports or upload_time > latest_reports['reports'].get('upload_time', ''):
-                latest_reports['reports'] = report
-        elif csv_type == 'inventory_overall':
-            if 'overall' not in latest_inventory or upload_time > latest_inventory['overall'].get('upload_time', ''):
-                latest_inventory['overall'] = report
-        elif csv_type == 'inventory_daily':
-            if 'daily' not in latest_inventory or upload_time > latest_inventory['daily'].get('upload_time', ''):
-                latest_inventory['daily'] = report
+    # A snapshot built from the same report files (by this worker before a restart,
+    # or by another worker) can be reused as is
+    snapshot = load_aggregated_snapshot(fingerprint)
+    if snapshot is not None:
+        print("🚀 Using aggregated data snapshot from disk")
+        aggregated_data_cache['data'] = snapshot
+        aggregated_data_cache['key'] = cache_key
+        aggregated_data_cache['fingerprint'] = fingerprint
+        aggregated_data_cache['timestamp'] = current_time
+        return snapshot
     
     # Load data from latest reports
     aggregated_data = {
@@ -358,64 +905,58 @@ def aggregate_all_reports_data():
     }
     
     # Load reports data
-    if 'reports' in latest_reports:
+    if 'reports' in latest_reports_by_section:
         try:
-            with open(latest_reports['reports']['report_path'], 'r') as f:
-                reports_data = json.load(f)
-                aggregated_data['overview'] = reports_data.get('overview', {})
-                aggregated_data['top_campaigns'] = reports_data.get('top_campaigns', [])
-                aggregated_data['creative_performance'] = reports_data.get('creative_performance', {'top_performers': []})
-                aggregated_data['exchange_performance'] = reports_data.get('exchange_performance', [])
-                aggregated_data['geographic_performance'] = reports_data.get('geographic_performance', [])
-                aggregated_data['gambling_insights'] = reports_data.get('gambling_insights', {})
+            reports_data = load_processed_report(
+                latest_reports_by_section['reports']['report_path'],
+                ('top_campaigns', 'top_performers', 'exchange_performance', 'geographic_performance')
+            )
+            aggregated_data['overview'] = reports_data.get('overview', {})
+            aggregated_data['top_campaigns'] = reports_data.get('top_campaigns', [])
+            aggregated_data['creative_performance'] = reports_data.get('creative_performance', {'top_performers': []})
+            aggregated_data['exchange_performance'] = reports_data.get('exchange_performance', [])
+            aggregated_data['geographic_performance'] = reports_data.get('geographic_performance', [])
+            aggregated_data['gambling_insights'] = reports_data.get('gambling_insights', {})
         except Exception as e:
             print(f"❌ Error loading reports data: {e}")
     
     # Load inventory data
-    if 'overall' in latest_inventory:
+    if 'overall' in latest_reports_by_section:
         try:
-            with open(latest_inventory['overall']['report_path'], 'r') as f:
-                inventory_data = json.load(f)
-                aggregated_data['inventory_app_analysis'] = inventory_data.get('inventory_app_analysis', {'apps': [], 'categories': [], 'total_apps': 0})
+            inventory_data = load_processed_report(latest_reports_by_section['overall']['report_path'], ('apps',))
+            aggregated_data['inventory_app_analysis'] = inventory_data.get('inventory_app_analysis', {'apps': [], 'categories': [], 'total_apps': 0})
         except Exception as e:
             print(f"❌ Error loading inventory overall data: {e}")
     
     # Create daily breakdown from all daily files
     daily_files = [r for r in processed_reports if r.get('csv_type') == 'inventory_daily']
     daily_breakdown = []
+    prefetch_daily_breakdowns([r['report_path'] for r in daily_files])
     
     for daily_file in daily_files:
         try:
-            with open(daily_file['report_path'], 'r') as f:
-                daily_data = json.load(f)
-                daily_breakdown.extend(daily_data.get('daily_breakdown', []))
+            daily_breakdown.extend(get_daily_breakdown(daily_file['report_path']))
         except Exception as e:
             print(f"❌ Error loading daily data from {daily_file['filename']}: {e}")
     
     # If no daily breakdown from files, create from reports data
     if not daily_breakdown and aggregated_data['overview']:
-        # Create mock daily breakdown from overview data
-        total_spend = aggregated_data['overview'].get('total_spend', 0)
-        total_impressions = aggregated_data['overview'].get('total_impressions', 0)
-        total_installs = aggregated_data['overview'].get('total_installs', 0)
-        total_actions = aggregated_data['overview'].get('total_actions', 0)
-        
-        # Distribute data across 5 days
-        daily_breakdown = []
-        for i in range(5):
-            day_data = {
-                'date': f'2025-08-{i+1:02d}',
-                'spend': total_spend / 5,
-                'impressions': total_impressions / 5,
-                'clicks': (total_impressions * 0.02) / 5,  # 2% CTR
-                'installs': total_installs / 5,
-                'actions': total_actions / 5,
-                'revenue': (total_spend * 1.5) / 5,  # 1.5x ROAS
-                'cpi': aggregated_data['overview'].get('avg_cpi', 0),
-                'roas': aggregated_data['overview'].get('avg_roas', 0),
-                'ctr': aggregated_data['overview'].get('avg_ctr', 0)
-            }
-            daily_breakdown.append(day_data)
+        # Create mock daily breakdown from overview data: the same averages on each of 5 days
+        overview = aggregated_data['overview']
+        total_spend = overview.get('total_spend', 0)
+        total_impressions = overview.get('total_impressions', 0)
+        day_data = {
+            'spend': total_spend / 5,
+            'impressions': total_impressions / 5,
+            'clicks': (total_impressions * 0.02) / 5,  # 2% CTR
+            'installs': overview.get('total_installs', 0) / 5,
+            'actions': overview.get('total_actions', 0) / 5,
+            'revenue': (total_spend * 1.5) / 5,  # 1.5x ROAS
+            'cpi': overview.get('avg_cpi', 0),
+            'roas': overview.get('avg_roas', 0),
+            'ctr': overview.get('avg_ctr', 0)
+        }
+        daily_breakdown = [{'date': f'2025-08-{i+1:02d}', **day_data} for i in range(5)]
     
     aggregated_data['daily_breakdown'] = daily_breakdown
     
@@ -423,8 +964,11 @@ def aggregate_all_reports_data():
     
     # Cache the result
     aggregated_data_cache['data'] = aggregated_data
-    aggregated_data_cache['hash'] = reports_hash
+    aggregated_data_cache['key'] = cache_key
+    aggregated_data_cache['fingerprint'] = fingerprint
     aggregated_data_cache['timestamp'] = current_time
+    # The snapshot is only a restart aid; write it without holding up the response
+    executor.submit(save_aggregated_snapshot, fingerprint, aggregated_data)
     print("💾 Cached aggregated data for future requests")
     
     return aggregated_data
@@ -433,23 +977,19 @@ def aggregate_all_reports_data():
 async def delete_report(report_id: int):
     """Delete processed report"""
     
-    global processed_reports
+    global processed_reports, reports_version
     
     # Find and remove report
-    report_to_delete = None
-    for i, r in enumerate(processed_reports):
-        if r['id'] == report_id:
-            report_to_delete = r
-            processed_reports.pop(i)
-            break
-    
+    report_to_delete = discard_report(report_id)
     if not report_to_delete:
         raise HTTPException(status_code=404, detail="Report not found")
+    reports_version += 1
+    save_reports_index()
     
     try:
-        # Delete files
-        if os.path.exists(report_to_delete['report_path']):
-            os.remove(report_to_delete['report_path'])
+        # Delete files (off the event loop; the report is already unregistered)
+        evict_report_caches(report_to_delete['report_path'])
+        await asyncio.get_running_loop().run_in_executor(executor, remove_report_files, report_to_delete['report_path'])
         
         return {
             'success': True,
@@ -473,16 +1013,14 @@ async def get_analytics_overview():
             }
         }
     
-    total_spend = sum(report.get('spend', 0) for report in processed_reports)
-    accounts = list(set(report['account'] for report in processed_reports))
-    
+    # Totals are maintained as reports are added and removed
     return {
         'success': True,
         'overview': {
             'total_reports': len(processed_reports),
-            'total_spend': total_spend,
-            'accounts': accounts,
-            'latest_upload': max(report['upload_time'] for report in processed_reports)
+            'total_spend': reports_totals['spend'],
+            'accounts': list(reports_totals['accounts']),
+            'latest_upload': reports_totals['latest_upload']
         }
     }
 
@@ -543,29 +1081,14 @@ async def get_app_statistics():
 async def get_available_dates():
     """Get available dates from processed data"""
     try:
-        dates = set()
-        
-        # Extract dates from daily breakdown data
-        for report in processed_reports:
-            try:
-                with open(report['report_path'], 'r') as f:
-                    data = json.load(f)
-                    daily_breakdown = data.get('daily_breakdown', [])
-                    for day_data in daily_breakdown:
-                        if 'date' in day_data:
-                            dates.add(day_data['date'])
-            except Exception as e:
-                print(f"❌ Error reading dates from {report['filename']}: {e}")
+        # Dates are summarized per report at upload time
+        sorted_dates = available_report_values('dates')
         
         # If no dates found, generate some mock dates
-        if not dates:
+        if not sorted_dates:
             from datetime import datetime, timedelta
             base_date = datetime.now() - timedelta(days=14)
-            for i in range(14):
-                date = base_date + timedelta(days=i)
-                dates.add(date.strftime('%Y-%m-%d'))
-        
-        sorted_dates = sorted(list(dates))
+            sorted_dates = [(base_date + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(14)]
         
         return {
             "dates": sorted_dates,
@@ -580,26 +1103,15 @@ async def get_available_dates():
 async def get_available_countries():
     """Get available countries from processed data"""
     try:
-        countries = set()
-        
-        # Extract countries from geographic performance data
-        for report in processed_reports:
-            try:
-                with open(report['report_path'], 'r') as f:
-                    data = json.load(f)
-                    geo_performance = data.get('geographic_performance', [])
-                    for geo_data in geo_performance:
-                        if 'country' in geo_data:
-                            countries.add(geo_data['country'])
-            except Exception as e:
-                print(f"❌ Error reading countries from {report['filename']}: {e}")
+        # Countries are summarized per report at upload time
+        countries = available_report_values('countries')
         
         # Add some common countries if none found
         if not countries:
-            countries = {'US', 'GB', 'FR', 'DE', 'JP', 'AU', 'CA', 'BR', 'IN', 'RU'}
+            countries = sorted({'US', 'GB', 'FR', 'DE', 'JP', 'AU', 'CA', 'BR', 'IN', 'RU'})
         
         return {
-            "countries": sorted(list(countries)),
+            "countries": countries,
             "count": len(countries)
         }
         
@@ -607,21 +1119,36 @@ async def get_available_countries():
         print(f"❌ Error getting available countries: {e}")
         return {"countries": [], "count": 0}
 
-# Filtered data endpoints
-@app.get("/reports/filtered")
-async def get_filtered_reports(
-    start_date: str = None,
-    end_date: str = None,
-    country: str = None
-):
-    """Get filtered reports data"""
-    try:
-        # Get all aggregated data
-        all_data = aggregate_all_reports_data()
+def filter_aggregated_data(aggregated_data: dict, start_date: str = None, end_date: str = None, country: str = None) -> dict:
+    """Apply /reports/filtered date and country filters to a copy of the aggregate"""
+    # Shallow copy: the aggregate itself is cached and shared
+    all_data = dict(aggregated_data)
+    
+    # Apply date filtering
+    if start_date or end_date:
+        daily_reports = [r for r in processed_reports if r.get('csv_type') == 'inventory_daily']
+        # Filter per report before merging: reports outside the range are skipped whole,
+        # the rest contribute a bisected slice of their date-sorted rows. Unreadable reports
+        # are skipped, as in aggregate_all_reports_data
+        filtered_daily = []
+        has_daily_rows = False
+        for report in daily_reports:
+            try:
+                ensure_report_summary(report)
+                if not dates_in_range(report['dates'], start_date, end_date):
+                    has_daily_rows = has_daily_rows or bool(report['dates'])
+                    continue
+                dates, rows = get_daily_breakdown_sorted(report['report_path'])
+            except Exception as e:
+                print(f"❌ Error loading daily data from {report['filename']}: {e}")
+                continue
+            has_daily_rows = has_daily_rows or bool(rows)
+            lo = bisect.bisect_left(dates, start_date) if start_date else 0
+            hi = bisect.bisect_right(dates, end_date) if end_date else len(dates)
+            filtered_daily.extend(rows[lo:hi])
         
-        # Apply date filtering
-        if start_date or end_date:
-            filtered_daily = []
+        if not has_daily_rows:
+            # The aggregate synthesized its breakdown (no daily rows at all); filter that instead
             for day_data in all_data.get('daily_breakdown', []):
                 day_date = day_data.get('date', '')
                 
@@ -634,18 +1161,46 @@ async def get_filtered_reports(
                 
                 if include_day:
                     filtered_daily.append(day_data)
-            
-            all_data['daily_breakdown'] = filtered_daily
-        
-        # Apply country filtering
-        if country:
-            # Filter geographic performance
-            filtered_geo = []
-            for geo_data in all_data.get('geographic_performance', []):
-                if geo_data.get('country', '').upper() == country.upper():
-                    filtered_geo.append(geo_data)
-            
-            all_data['geographic_performance'] = filtered_geo
+        
+        all_data['daily_breakdown'] = filtered_daily
+    
+    # Apply country filtering
+    if country:
+        # Filter geographic performance
+        filtered_geo = []
+        for geo_data in all_data.get('geographic_performance', []):
+            if geo_data.get('country', '').upper() == country:
+                filtered_geo.append(geo_data)
+        
+        all_data['geographic_performance'] = filtered_geo
+    
+    return all_data
+
+# Filtered data endpoints
+@app.get("/reports/filtered")
+async def get_filtered_reports(
+    start_date: str = None,
+    end_date: str = None,
+    country: str = None
+):
+    """Get filtered reports data"""
+    try:
+        # Filters are bucketed to whole days, so dashboard refreshes share one cached result
+        start_day = start_date[:10] if start_date else None
+        end_day = end_date[:10] if end_date else None
+        country_key = country.upper() if country else None
+        
+        aggregated_data = aggregate_all_reports_data()
+        if (filtered_reports_cache['source'] is not aggregated_data or
+            len(filtered_reports_cache['results']) >= FILTERED_CACHE_MAX_ENTRIES):
+            filtered_reports_cache['source'] = aggregated_data
+            filtered_reports_cache['results'] = {}
+        cache_key = (start_day, end_day, country_key)
+        if cache_key not in filtered_reports_cache['results']:
+            filtered_reports_cache['results'][cache_key] = filter_aggregated_data(
+                aggregated_data, start_day, end_day, country_key
+            )
+        all_data = filtered_reports_cache['results'][cache_key]
         
         return {
             'success': True,
@@ -686,13 +1241,22 @@ async def get_creatives(
         # Get creative performance data
         creatives = all_data.get('creative_performance', {}).get('top_performers', [])
         
-        # Apply sorting
+        # Apply sorting (each order is sorted once per creatives list, then only sliced)
         reverse = (sort_order.lower() == 'desc')
         
+        if sorted_creatives_cache['source'] is not creatives:
+            sorted_creatives_cache['source'] = creatives
+            sorted_creatives_cache['orders'] = {}
+        orders = sorted_creatives_cache['orders']
+        
         if sort_by in ['spend', 'installs', 'actions'] and creatives:
-            creatives.sort(key=lambda x: x.get(sort_by, 0), reverse=reverse)
+            if (sort_by, reverse) not in orders:
+                orders[(sort_by, reverse)] = sorted(creatives, key=lambda x: x.get(sort_by, 0), reverse=reverse)
+            creatives = orders[(sort_by, reverse)]
         elif sort_by == 'creative_name' and creatives:
-            creatives.sort(key=lambda x: x.get('creative_name', ''), reverse=reverse)
+            if (sort_by, reverse) not in orders:
+                orders[(sort_by, reverse)] = sorted(creatives, key=lambda x: x.get('creative_name', ''), reverse=reverse)
+            creatives = orders[(sort_by, reverse)]
         
         # Calculate pagination
         total_creatives = len(creatives)
@@ -722,6 +1286,60 @@ async def get_creatives(
         print(f"❌ Error getting paginated creatives: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting creatives: {str(e)}")
 
+async def get_reports_payload():
+    """/reports body for batch requests (no HTTP-level compression)"""
+    return build_reports_payload(aggregate_all_reports_data())
+
+# Read-only endpoints a dashboard loads together, dispatchable through /batch
+BATCH_ROUTES = {
+    '/reports': get_reports_payload,
+    '/reports/filtered': get_filtered_reports,
+    '/creatives': get_creatives,
+    '/available-dates': get_available_dates,
+    '/available-countries': get_available_countries,
+    '/analytics/overview': get_analytics_overview
+}
+
+@app.post("/batch")
+async def batch_requests(payload: dict):
+    """
+    Run several GET requests in one round trip
+    
+    - **requests**: list of {"id", "method", "url"}; url may carry a query string
+    
+    Sub-requests run in order in this process, so they share one aggregated_data_cache
+    entry instead of each rebuilding it.
+    """
+    responses = []
+    for sub_request in payload.get('requests', []):
+        request_id = sub_request.get('id')
+        url = urlsplit(sub_request.get('url', ''))
+        handler = BATCH_ROUTES.get(url.path)
+        
+        if sub_request.get('method', 'GET').upper() != 'GET':
+            responses.append({'id': request_id, 'status': 405, 'body': {'detail': 'Only GET is supported in batch'}})
+            continue
+        if handler is None:
+            responses.append({'id': request_id, 'status': 404, 'body': {'detail': 'Not Found'}})
+            continue
+        
+        try:
+            # Query values arrive as strings; cast to the handler's annotated type
+            parameters = inspect.signature(handler).parameters
+            kwargs = {}
+            for name, value in parse_qsl(url.query):
+                if name in parameters:
+                    annotation = parameters[name].annotation
+                    kwargs[name] = annotation(value) if annotation in (int, float) else value
+            
+            responses.append({'id': request_id, 'status': 200, 'body': await handler(**kwargs)})
+        except HTTPException as e:
+            responses.append({'id': request_id, 'status': e.status_code, 'body': {'detail': e.detail}})
+        except ValueError as e:
+            responses.append({'id': request_id, 'status': 422, 'body': {'detail': str(e)}})
+    
+    return {'responses': responses}
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)# Force Render redeploy
@@ -4,34 +4,143 @@ Moloco CSV Processor - Extracted from main.py for better architecture
 import pandas as pd
 import numpy as np
 import json
+import re
 from datetime import datetime
 from app_database import app_db
 
-def clean_nan_values(obj):
-    """Recursively clean NaN and Inf values from any object"""
-    if isinstance(obj, dict):
-        return {k: clean_nan_values(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [clean_nan_values(item) for item in obj]
-    elif isinstance(obj, (int, float)):
-        if pd.isna(obj) or np.isinf(obj):
-            return 0.0
-        return obj
-    else:
-        return obj
 from typing import Dict, List, Any, Optional
 import os
+import importlib.util
+
+# pyarrow is only probed here; pandas drives its multithreaded reader
+CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') is not None else 'c'
+
+# Every column process_reports_csv touches; the rest of a Reports export is skipped at parse time
+REPORT_COLUMNS = {
+    'Date', 'Countries', 'Campaign', 'Creative', 'Exchange', 'Country',
+    'Spend', 'Install', 'Impressions', 'Impression', 'Click', 'Clicks', 'Action', 'Actions',
+    'Revenue', 'D1 Revenue', 'D7 Revenue', 'D30 Revenue', 'Purchase', 'D1 Purchase',
+    'Completed View', '1Q(25%) View', '2Q(50%) View', '3Q(75%) View'
+}
+
+# Bundle ID patterns used by generate_store_links, compiled once per process
+NUMERIC_ID_RE = re.compile(r'\d+')
+ANDROID_PREFIXES = ('com.', 'org.', 'net.')
+
+# Filename date patterns for extract_date_from_filename, in priority order
+FILENAME_DATE_PATTERNS = (
+    re.compile(r'(\d{4})(\d{2})(\d{2})'),  # YYYYMMDD
+    re.compile(r'(\d{2})-(\d{2})-(\d{4})'),  # DD-MM-YYYY
+    re.compile(r'(\d{4})-(\d{2})-(\d{2})'),  # YYYY-MM-DD
+)
+
+# Alternative export names for the same metric, in priority order
+IMPRESSION_COLUMNS = ['Impressions', 'Impression']
+REVENUE_COLUMNS = ['Revenue', 'D1 Revenue', 'D7 Revenue', 'D30 Revenue', 'Purchase', 'D1 Purchase']
+
+# Count metrics downcast_integer_columns may narrow; money columns keep their parsed dtype
+COUNT_COLUMNS = {
+    'Impressions', 'Impression', 'Install', 'Click', 'Clicks', 'Action', 'Actions',
+    'Completed View', '1Q(25%) View', '2Q(50%) View', '3Q(75%) View'
+}
+
+def first_present(candidates: List[str], columns) -> Optional[str]:
+    """Return the first candidate column present in columns, or None"""
+    return next((col for col in candidates if col in columns), None)
+
+def has_binary_columns(df: pd.DataFrame) -> bool:
+    """pyarrow types columns with invalid UTF-8 as raw bytes instead of raising"""
+    for col in df.columns[df.dtypes == object]:
+        values = df[col].dropna()
+        if len(values) and isinstance(values.iloc[0], bytes):
+            return True
+    return False
+
+def read_csv_with_fallback(filepath: str, **kwargs) -> pd.DataFrame:
+    """pd.read_csv that falls back to the C engine when pyarrow rejects a file, and retries
+    legacy (non UTF-8) exports as latin-1"""
+    if kwargs.get('engine') == 'pyarrow':
+        try:
+            df = pd.read_csv(filepath, **kwargs)
+            if not has_binary_columns(df):
+                return df
+        except Exception as e:
+            print(f"⚠️ pyarrow could not parse {filepath}, retrying with the C engine: {e}")
+        kwargs.pop('engine')
+        kwargs.pop('memory_map', None)
+    try:
+        return pd.read_csv(filepath, **kwargs)
+    except UnicodeDecodeError:
+        pass
+    kwargs.pop('engine', None)
+    kwargs.pop('memory_map', None)
+    return pd.read_csv(filepath, encoding='latin-1', **kwargs)
+
+def sanitize_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Replace NaN and Inf values in bulk before converting a frame to records
+    
+    Makes a single copy (fillna). Inf can only live in float columns, so only those are
+    checked, with one numpy isinf pass each; string columns are never compared.
+    """
+    sanitized = frame.fillna(0)
+    for position, dtype in enumerate(sanitized.dtypes):
+        if not pd.api.types.is_float_dtype(dtype):
+            continue
+        values = sanitized.iloc[:, position].to_numpy()
+        infinite = np.isinf(values)
+        if infinite.any():
+            sanitized.iloc[:, position] = np.where(infinite, 0.0, values)
+    return sanitized
+
+def downcast_integer_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Store int64 COUNT_COLUMNS in the smallest integer dtype that holds them
+    
+    Sums still accumulate in int64, so totals cannot overflow. Spend and revenue are never
+    narrowed, even when an export only has whole values and they parse as int64.
+    """
+    for col in df.columns[df.dtypes == np.int64]:
+        if col in COUNT_COLUMNS:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+def clean_nan_value(value):
+    """Clean a single NaN or Inf scalar (for values that never sit in a DataFrame)"""
+    if isinstance(value, (int, float)) and (pd.isna(value) or np.isinf(value)):
+        return 0.0
+    return value
+
+def group_sum_count(df: pd.DataFrame, key: str, columns: List[str], key_name: str) -> pd.DataFrame:
+    """Per-key sums plus row count in one pass over factorized keys
+    
+    Replaces a groupby().agg() followed by a second groupby().size(). Sums use np.bincount
+    kernels; integer columns keep their integer dtype. Missing columns get the row count,
+    which the old 'count' aggregation meant to produce but could not select.
+    """
+    codes, uniques = pd.factorize(df[key], sort=True)
+    valid = codes >= 0  # NaN keys are dropped, as groupby does
+    codes = codes[valid]
+    counts = np.bincount(codes, minlength=len(uniques))
+    
+    result = {key_name: uniques}
+    for col in columns:
+        if col not in df.columns:
+            result[col] = counts
+            continue
+        sums = np.bincount(codes, weights=df[col].fillna(0).to_numpy(dtype=float)[valid], minlength=len(uniques))
+        result[col] = sums.astype(np.int64) if pd.api.types.is_integer_dtype(df[col]) else sums
+    result['count'] = counts
+    return pd.DataFrame(result)
 
 def generate_store_links(bundle_id: str, platform: str = None) -> Dict[str, str]:
     """Generate App Store and Google Play links from bundle ID"""
-    if not bundle_id or pd.isna(bundle_id):
+    if not bundle_id or bundle_id != bundle_id:  # empty or NaN
         return {'app_store': None, 'google_play': None}
     
     bundle_id = str(bundle_id).strip()
     
     # Try to detect platform from bundle ID
     if not platform:
-        if bundle_id.startswith('com.') or bundle_id.startswith('org.') or bundle_id.startswith('net.'):
+        if bundle_id.startswith(ANDROID_PREFIXES):
             platform = 'android'
         elif bundle_id.startswith('id') or bundle_id.isdigit():
             platform = 'ios'
@@ -46,34 +155,57 @@ def generate_store_links(bundle_id: str, platform: str = None) -> Dict[str, str]
             links['app_store'] = f"https://apps.apple.com/app/id{bundle_id}"
         else:
             # Try to extract numeric ID from bundle
-            import re
-            numeric_id = re.search(r'\d+', bundle_id)
+            numeric_id = NUMERIC_ID_RE.search(bundle_id)
             if numeric_id:
                 links['app_store'] = f"https://apps.apple.com/app/id{numeric_id.group()}"
     
-    if platform == 'android' or bundle_id.startswith(('com.', 'org.', 'net.')):
+    if platform == 'android' or bundle_id.startswith(ANDROID_PREFIXES):
         # Google Play Store
         links['google_play'] = f"https://play.google.com/store/apps/details?id={bundle_id}"
     
     return links
 
+def generate_store_link_columns(bundles: pd.Series, platforms: pd.Series):
+    """Vectorized generate_store_links over whole bundle/OS columns
+    
+    Returns (app_store, google_play) object arrays holding a URL or None per row.
+    """
+    b = bundles.astype(str).str.strip()
+    valid = bundles.notna().to_numpy() & (b != '').to_numpy()
+    platform = platforms.astype('string').str.lower().fillna('')
+    
+    is_digit = b.str.isdigit().to_numpy()
+    is_android_prefix = b.str.startswith(ANDROID_PREFIXES).to_numpy()
+    # Bundles without an OS fall back to the prefix-based detection of generate_store_links
+    detected = np.select(
+        [is_android_prefix, b.str.startswith('id').to_numpy() | is_digit],
+        ['android', 'ios'],
+        'unknown'
+    )
+    platform = np.where(platform.to_numpy() == '', detected, platform.to_numpy())
+    
+    numeric_id = b.str.extract(f"({NUMERIC_ID_RE.pattern})", expand=False)
+    ios = valid & ((platform == 'ios') | is_digit)
+    app_store = np.where(
+        ios & is_digit, 'https://apps.apple.com/app/id' + b,
+        np.where(ios & numeric_id.notna().to_numpy(), 'https://apps.apple.com/app/id' + numeric_id, None)
+    )
+    google_play = np.where(
+        valid & ((platform == 'android') | is_android_prefix),
+        'https://play.google.com/store/apps/details?id=' + b,
+        None
+    )
+    return app_store, google_play
+
 def extract_date_from_filename(filename: str) -> str:
     """Extract date from filename for daily breakdown"""
-    import re
-    date_patterns = [
-        r'(\d{4})(\d{2})(\d{2})',  # YYYYMMDD
-        r'(\d{2})-(\d{2})-(\d{4})',  # DD-MM-YYYY
-        r'(\d{4})-(\d{2})-(\d{2})',  # YYYY-MM-DD
-    ]
-    
-    for pattern in date_patterns:
-        match = re.search(pattern, filename)
+    for pattern in FILENAME_DATE_PATTERNS:
+        match = pattern.search(filename)
         if match:
-            if len(match.groups()) == 3:
-                if len(match.group(1)) == 4:  # YYYYMMDD or YYYY-MM-DD
-                    return f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
-                else:  # DD-MM-YYYY
-                    return f"{match.group(3)}-{match.group(2)}-{match.group(1)}"
+            if len(match.group(1)) == 4:  # YYYYMMDD or YYYY-MM-DD
+                return f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
+            else:  # DD-MM-YYYY
+                return f"{match.group(3)}-{match.group(2)}-{match.group(1)}"
     
     return datetime.now().strftime('%Y-%m-%d')
 
@@ -86,13 +218,14 @@ class MolocoCSVProcessor:
     def load_and_detect_type(self, filepath: str) -> Dict[str, Any]:
         """Load CSV and detect its type (Reports, Inventory Overall, Inventory Daily)"""
         try:
-            self.df = pd.read_csv(filepath)
+            # Peek at the header only; the type is decided before the full parse
+            header = list(read_csv_with_fallback(filepath, nrows=0, memory_map=True).columns)
             
             # Debug: Print columns for analysis
-            print(f"🔍 CSV Columns: {list(self.df.columns)}")
+            print(f"🔍 CSV Columns: {header}")
             
             # Detect CSV type based on columns
-            columns = set(self.df.columns)
+            columns = set(header)
             
             # More flexible detection logic
             if 'Campaign' in columns:
@@ -118,12 +251,26 @@ class MolocoCSVProcessor:
                     self.csv_type = 'unknown'
             
             print(f"🎯 Detected CSV type: {self.csv_type}")
+            
+            # Inventory files keep every column (they are echoed per app), reports only what is aggregated
+            usecols = [col for col in header if col in REPORT_COLUMNS] if self.csv_type == 'reports' else None
+            # Keep dates as plain strings. Only the C engine gets a dtype hint: with pyarrow it
+            # breaks the casts of integer columns that have blank cells, so Date is cast below
+            dtype = {'Date': str} if 'Date' in columns and CSV_ENGINE == 'c' else None
+            # The C engine can parse straight from the OS page cache; pyarrow has its own reader
+            memory_map = CSV_ENGINE == 'c'
+            self.df = downcast_integer_columns(read_csv_with_fallback(
+                filepath, engine=CSV_ENGINE, usecols=usecols, dtype=dtype, memory_map=memory_map
+            ))
+            if 'Date' in self.df.columns and not pd.api.types.is_string_dtype(self.df['Date']):
+                # pyarrow infers date objects; missing dates stay NaN
+                self.df['Date'] = self.df['Date'].astype('str')
                 
             return {
                 'success': True,
                 'type': self.csv_type,
                 'rows': len(self.df),
-                'columns': list(self.df.columns)
+                'columns': header
             }
             
         except Exception as e:
@@ -132,6 +279,21 @@ class MolocoCSVProcessor:
                 'error': str(e)
             }
     
+    def _group_sum(self, key: str, num_df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """Sum numeric columns per key (key column first, in order of first appearance)
+        
+        String keys are factorized to integer codes once, so the groupby hashes ints instead
+        of Python strings; the labels are mapped back afterwards. NaN keys are dropped.
+        """
+        codes, uniques = pd.factorize(self.df[key], sort=False)
+        values = num_df[columns]
+        if (codes < 0).any():
+            valid = codes >= 0
+            codes, values = codes[valid], values[valid]
+        stats = values.groupby(codes, sort=False).sum()
+        stats.insert(0, key, uniques.take(stats.index.to_numpy()))
+        return stats.reset_index(drop=True)
+    
     def process_reports_csv(self, date_filter: str = None, start_date: str = None, end_date: str = None, country: str = None) -> Dict[str, Any]:
         """Process Reports CSV type with optional date filtering
         
@@ -145,14 +307,7 @@ class MolocoCSVProcessor:
         
         # Apply date filtering if specified
         original_rows = len(self.df)
-        print(f"🔍 DEBUG: DataFrame columns: {list(self.df.columns)}")
-        print(f"🔍 DEBUG: DataFrame shape: {self.df.shape}")
         if 'Date' in self.df.columns:
-            print(f"🔍 DEBUG: Date column found!")
-            print(f"🔍 DEBUG: First 5 dates: {self.df['Date'].head().tolist()}")
-            print(f"🔍 DEBUG: Date column dtype: {self.df['Date'].dtype}")
-            print(f"🔍 DEBUG: Unique dates count: {self.df['Date'].nunique()}")
-            print(f"🔍 DEBUG: Date range: {self.df['Date'].min()} to {self.df['Date'].max()}")
             if date_filter:
                 # Single date filter
                 self.df = self.df[self.df['Date'] == date_filter]
@@ -178,9 +333,6 @@ class MolocoCSVProcessor:
             original_rows_country = len(self.df)
             # Convert country code to uppercase for matching
             country_code = country.upper()
-            print(f"🌍 DEBUG: Filtering by country: {country_code}")
-            print(f"🌍 DEBUG: Available countries: {self.df['Countries'].unique()[:10]}")
-            
             # Filter by country code (exact match)
             self.df = self.df[self.df['Countries'] == country_code]
             print(f"🌍 Country filter '{country_code}': {original_rows_country} → {len(self.df)} rows")
@@ -196,43 +348,42 @@ class MolocoCSVProcessor:
                     'gambling_insights': {},
                     'daily_breakdown': []
                 }
-        else:
-            print(f"⚠️ DEBUG: 'Date' column not found! Available columns: {list(self.df.columns)}")
-            # Try to find date column with different names
-            date_cols = [col for col in self.df.columns if 'date' in col.lower()]
-            if date_cols:
-                print(f"🔍 DEBUG: Found potential date columns: {date_cols}")
             
-        # Basic aggregations
-        total_spend = float(self.df['Spend'].sum()) if 'Spend' in self.df.columns else 0
-        total_installs = int(self.df['Install'].sum()) if 'Install' in self.df.columns else 0
+        # Resolve the impression/revenue column names once for every block below
+        impression_col_found = first_present(IMPRESSION_COLUMNS, self.df.columns)
+        revenue_columns = REVENUE_COLUMNS
+        agg_revenue_col = first_present(revenue_columns, self.df.columns)
+        
+        # Shared numeric block for the overview and the Campaign/Creative/Exchange/Country
+        # groupbys, built once so each dimension only hashes its key column
+        sum_candidates = [
+            'Spend', 'Install', 'Click', 'Clicks', 'Action', 'Actions', 'Impressions', 'Impression',
+            *revenue_columns, 'Completed View', '1Q(25%) View', '2Q(50%) View', '3Q(75%) View'
+        ]
+        num_df = self.df[[col for col in dict.fromkeys(sum_candidates) if col in self.df.columns]].fillna(0)
+        
+        # Basic aggregations - one column-wise sum; non-numeric columns drop out and count as missing
+        sums = num_df.sum(numeric_only=True)
+        total_spend = float(sums.get('Spend', 0))
+        total_installs = int(sums.get('Install', 0))
+        
         # Check for different impression column names
-        impression_columns = ['Impressions', 'Impression']
         total_impressions = 0
-        for col in impression_columns:
-            if col in self.df.columns:
-                try:
-                    total_impressions = int(self.df[col].sum())
-                    print(f"👁️ Found impression column: {col} = {total_impressions}")
-                    break
-                except (ValueError, TypeError) as e:
-                    print(f"⚠️ Error processing impression column {col}: {e}")
-                    continue
+        for col in IMPRESSION_COLUMNS:
+            if col in sums:
+                total_impressions = int(sums[col])
+                print(f"👁️ Found impression column: {col} = {total_impressions}")
+                break
         
         # Check for different revenue column names
-        revenue_columns = ['Revenue', 'D1 Revenue', 'D7 Revenue', 'D30 Revenue', 'Purchase', 'D1 Purchase']
         total_revenue = 0
         revenue_col_found = None
         for col in revenue_columns:
-            if col in self.df.columns:
-                try:
-                    total_revenue = float(self.df[col].sum())
-                    revenue_col_found = col
-                    print(f"💰 Found revenue column: {col} = {total_revenue}")
-                    break
-                except (ValueError, TypeError) as e:
-                    print(f"⚠️ Error processing revenue column {col}: {e}")
-                    continue
+            if col in sums:
+                total_revenue = float(sums[col])
+                revenue_col_found = col
+                print(f"💰 Found revenue column: {col} = {total_revenue}")
+                break
         
         # Calculate metrics
         avg_cpi = total_spend / total_installs if total_installs > 0 else 0
@@ -241,15 +392,11 @@ class MolocoCSVProcessor:
         avg_roas = total_revenue / total_spend if total_spend > 0 else 0
         
         # Safe CTR calculation - use already calculated total_impressions
-        total_clicks = int(self.df['Click'].sum()) if 'Click' in self.df.columns else 0
-        if total_clicks == 0:
-            total_clicks = int(self.df['Clicks'].sum()) if 'Clicks' in self.df.columns else 0
+        total_clicks = int(sums.get('Click', 0)) or int(sums.get('Clicks', 0))
         avg_ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
         
         # Calculate total actions
-        total_actions = int(self.df['Action'].sum()) if 'Action' in self.df.columns else 0
-        if total_actions == 0:
-            total_actions = int(self.df['Actions'].sum()) if 'Actions' in self.df.columns else 0
+        total_actions = int(sums.get('Action', 0)) or int(sums.get('Actions', 0))
         
         print(f"📊 Metrics: Spend={total_spend}, Impressions={total_impressions}, Clicks={total_clicks}, Installs={total_installs}, Actions={total_actions}")
         
@@ -266,26 +413,19 @@ class MolocoCSVProcessor:
         elif 'Actions' in self.df.columns:
             agg_dict['Actions'] = 'sum'
         # Add impression column if exists
-        impression_columns = ['Impressions', 'Impression']
-        impression_col_found = None
-        for col in impression_columns:
-            if col in self.df.columns:
-                agg_dict[col] = 'sum'
-                impression_col_found = col
-                print(f"👁️ Found impression column for aggregation: {col}")
-                break
+        if impression_col_found:
+            agg_dict[impression_col_found] = 'sum'
+            print(f"👁️ Found impression column for aggregation: {impression_col_found}")
         
         # After aggregation, rename the column to 'Impressions' for consistency
         if impression_col_found:
             print(f"🔄 Will rename {impression_col_found} to 'Impressions' in results")
         
         # Check for revenue columns in campaigns
-        for col in revenue_columns:
-            if col in self.df.columns:
-                agg_dict[col] = 'sum'
-                break
+        if agg_revenue_col:
+            agg_dict[agg_revenue_col] = 'sum'
             
-        campaign_stats = self.df.groupby('Campaign').agg(agg_dict).reset_index()
+        campaign_stats = self._group_sum('Campaign', num_df, list(agg_dict))
         
         # Rename columns for consistency
         if impression_col_found and impression_col_found != 'Impressions':
@@ -329,19 +469,14 @@ class MolocoCSVProcessor:
             campaign_stats['CPA'] = 0
 
         # Calculate ROAS for campaigns
-        revenue_col = None
-        for col in revenue_columns:
-            if col in campaign_stats.columns:
-                revenue_col = col
-                break
-                
+        revenue_col = agg_revenue_col
         if revenue_col and campaign_stats['Spend'].sum() > 0:
             campaign_stats['ROAS'] = campaign_stats[revenue_col] / campaign_stats['Spend']
             campaign_stats['ROAS'] = campaign_stats['ROAS'].fillna(0).replace([np.inf, -np.inf], 0)
         else:
             campaign_stats['ROAS'] = 0
             
-        top_campaigns = campaign_stats.nlargest(10, 'Spend').to_dict('records')
+        top_campaigns = sanitize_frame(campaign_stats.nlargest(10, 'Spend')).to_dict('records')
         
         # Creative performance - safe aggregation
         if 'Creative' in self.df.columns:
@@ -357,14 +492,9 @@ class MolocoCSVProcessor:
             elif 'Clicks' in self.df.columns:
                 creative_agg['Clicks'] = 'sum'
             # Add impression column if exists
-            impression_columns = ['Impressions', 'Impression']
-            impression_col_found = None
-            for col in impression_columns:
-                if col in self.df.columns:
-                    creative_agg[col] = 'sum'
-                    impression_col_found = col
-                    print(f"👁️ Found impression column for creatives: {col}")
-                    break
+            if impression_col_found:
+                creative_agg[impression_col_found] = 'sum'
+                print(f"👁️ Found impression column for creatives: {impression_col_found}")
             if 'Completed View' in self.df.columns:
                 creative_agg['Completed View'] = 'sum'
             if '1Q(25%) View' in self.df.columns:
@@ -374,7 +504,7 @@ class MolocoCSVProcessor:
             if '3Q(75%) View' in self.df.columns:
                 creative_agg['3Q(75%) View'] = 'sum'
                 
-            creative_stats = self.df.groupby('Creative').agg(creative_agg).reset_index()
+            creative_stats = self._group_sum('Creative', num_df, list(creative_agg))
             
             # Check results after grouping
             print(f"🔍 Grouped {creative_stats.shape[0]} creatives successfully")
@@ -438,18 +568,17 @@ class MolocoCSVProcessor:
                     print(f"⚠️ Error calculating Revenue_per_Action: {e}")
                     creative_stats['Revenue_per_Action'] = 0
                 
-                # Performance tiers based on revenue per action
-                def get_performance_tier(revenue_per_action):
-                    if revenue_per_action >= 130 and revenue_per_action <= 189:
-                        return 'Tier 1'
-                    elif revenue_per_action >= 70 and revenue_per_action <= 129:
-                        return 'Tier 2'
-                    elif revenue_per_action >= 20 and revenue_per_action <= 69:
-                        return 'Tier 3'
-                    else:
-                        return 'Low'
-                        
-                creative_stats['Performance'] = creative_stats['Revenue_per_Action'].apply(get_performance_tier)
+                # Performance tiers based on revenue per action, assigned column-wise
+                revenue_per_action = creative_stats['Revenue_per_Action']
+                creative_stats['Performance'] = np.select(
+                    [
+                        revenue_per_action.between(130, 189),
+                        revenue_per_action.between(70, 129),
+                        revenue_per_action.between(20, 69)
+                    ],
+                    ['Tier 1', 'Tier 2', 'Tier 3'],
+                    default='Low'
+                )
             else:
                 creative_stats['Performance'] = 'Unknown'
                 
@@ -457,7 +586,7 @@ class MolocoCSVProcessor:
             print(f"🔍 Final creative stats: {creative_stats.shape[0]} creatives processed")
             
             # Sort by spend (descending) instead of CPI to get actual top performers
-            top_creatives = creative_stats.nlargest(20, 'Spend').to_dict('records')
+            top_creatives = sanitize_frame(creative_stats.nlargest(20, 'Spend')).to_dict('records')
             print(f"🎯 Selected top 20 creatives by spend (not CPI)")
         else:
             top_creatives = []
@@ -468,14 +597,9 @@ class MolocoCSVProcessor:
             if 'Install' in self.df.columns:
                 exchange_agg['Install'] = 'sum'
             # Add impression column if exists
-            impression_columns = ['Impressions', 'Impression']
-            impression_col_found = None
-            for col in impression_columns:
-                if col in self.df.columns:
-                    exchange_agg[col] = 'sum'
-                    impression_col_found = col
-                    print(f"👁️ Found impression column for exchanges: {col}")
-                    break
+            if impression_col_found:
+                exchange_agg[impression_col_found] = 'sum'
+                print(f"👁️ Found impression column for exchanges: {impression_col_found}")
             # Add clicks column if exists
             if 'Click' in self.df.columns:
                 exchange_agg['Click'] = 'sum'
@@ -484,7 +608,7 @@ class MolocoCSVProcessor:
             if 'Action' in self.df.columns:
                 exchange_agg['Action'] = 'sum'
                 
-            exchange_stats = self.df.groupby('Exchange').agg(exchange_agg).reset_index()
+            exchange_stats = self._group_sum('Exchange', num_df, list(exchange_agg))
             
             # Rename impression column to 'Impressions' for consistency
             if impression_col_found and impression_col_found != 'Impressions':
@@ -530,35 +654,29 @@ class MolocoCSVProcessor:
                 exchange_stats['CTR'] = 0
                 
             # Calculate ROAS if revenue data is available
-            revenue_col = None
-            for col in revenue_columns:
-                if col in exchange_stats.columns:
-                    revenue_col = col
-                    break
-                    
+            revenue_col = first_present(revenue_columns, exchange_stats.columns)
             if revenue_col and exchange_stats['Spend'].sum() > 0:
                 exchange_stats['ROAS'] = exchange_stats[revenue_col] / exchange_stats['Spend']
                 exchange_stats['ROAS'] = exchange_stats['ROAS'].fillna(0).replace([np.inf, -np.inf], 0)
             else:
                 exchange_stats['ROAS'] = 0
                 
-            exchange_performance = exchange_stats.nlargest(15, 'Spend').to_dict('records')
+            exchange_performance = sanitize_frame(exchange_stats.nlargest(15, 'Spend')).to_dict('records')
         else:
             exchange_performance = []
         
         # Geographic performance
         if 'Country' in self.df.columns:
-            geo_stats = self.df.groupby('Country').agg({
-                'Spend': 'sum',
-                'Install': 'sum'
-            }).reset_index()
+            geo_stats = self._group_sum(
+                'Country', num_df.reindex(columns=['Spend', 'Install'], fill_value=0), ['Spend', 'Install']
+            )
             geo_stats['CPI'] = geo_stats['Spend'] / geo_stats['Install'].replace(0, 1)
             geo_stats['CPI'] = geo_stats['CPI'].fillna(0).replace([np.inf, -np.inf], 0)
             
-            geo_performance = geo_stats.nlargest(10, 'Spend').to_dict('records')
+            geo_performance = sanitize_frame(geo_stats.nlargest(10, 'Spend')).to_dict('records')
             
-            # Detect game types from campaign names
-            campaigns = self.df['Campaign'].str.lower()
+            # Detect game types from campaign names (each distinct name is scanned once)
+            campaigns = pd.Series(self.df['Campaign'].unique()).str.lower()
             detected_games = []
             
             game_keywords = {
@@ -584,17 +702,6 @@ class MolocoCSVProcessor:
             geo_performance = []
             gambling_insights = {}
         
-        # Clean all data to remove NaN values
-        def clean_nan_values(obj):
-            if isinstance(obj, dict):
-                return {k: clean_nan_values(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [clean_nan_values(item) for item in obj]
-            elif isinstance(obj, float) and (pd.isna(obj) or np.isinf(obj)):
-                return 0.0
-            else:
-                return obj
-        
         result = {
             'overview': {
                 'total_spend': total_spend,
@@ -618,7 +725,9 @@ class MolocoCSVProcessor:
             'daily_breakdown': []  # Will be implemented when we have date data
         }
         
-        return clean_nan_values(result)
+        # Frames were sanitized before to_dict, only overview scalars remain
+        result['overview'] = {k: clean_nan_value(v) for k, v in result['overview'].items()}
+        return result
     
     def process_inventory_csv(self, filename: str = None) -> Dict[str, Any]:
         """Process Inventory CSV types with daily breakdown support"""
@@ -630,11 +739,13 @@ class MolocoCSVProcessor:
         total_installs = self.df['Install'].sum() if 'Install' in self.df.columns else 0
         total_impressions = self.df['Impression'].sum() if 'Impression' in self.df.columns else 0
         total_revenue = self.df['D1 Revenue'].sum() if 'D1 Revenue' in self.df.columns else 0
+        total_actions = int(self.df['Action'].sum()) if 'Action' in self.df.columns else 0
+        total_clicks = int(self.df['Click'].sum()) if 'Click' in self.df.columns else 0
         
         # Calculate averages
         avg_cpi = total_spend / total_installs if total_installs > 0 else 0
         avg_roas = total_revenue / total_spend if total_spend > 0 else 0
-        avg_ctr = (self.df['Click'].sum() / total_impressions * 100) if total_impressions > 0 else 0
+        avg_ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
         
         # Generate daily breakdown
         daily_breakdown = []
@@ -646,9 +757,9 @@ class MolocoCSVProcessor:
                 'date': date_str,
                 'spend': total_spend,
                 'impressions': total_impressions,
-                'clicks': self.df['Click'].sum() if 'Click' in self.df.columns else 0,
+                'clicks': total_clicks,
                 'installs': total_installs,
-                'actions': self.df['Action'].sum() if 'Action' in self.df.columns else 0,
+                'actions': total_actions,
                 'revenue': total_revenue,
                 'cpi': avg_cpi,
                 'roas': avg_roas,
@@ -657,36 +768,23 @@ class MolocoCSVProcessor:
         
         # Clean and prepare data with improved store links
         apps_data = []
-        for _, row in self.df.iterrows():
-            app_data = row.to_dict()
-            
-            # Get bundle ID from various possible column names
-            bundle_id = None
-            platform = None
-            
-            # Try different bundle ID column names
-            bundle_columns = [
-                'Inventory - App Bundle', 'App Bundle', 'Bundle ID', 'iOS Bundle ID', 
-                'Android Bundle ID', 'Bundle_ID', 'App_Bundle'
-            ]
-            
-            for col in bundle_columns:
-                if col in row and not pd.isna(row[col]):
-                    bundle_id = str(row[col]).strip()
-                    break
-            
-            # Determine platform
-            if 'OS' in row:
-                platform = row['OS'].lower() if not pd.isna(row['OS']) else None
-            
-            # Generate store links
-            store_links = generate_store_links(bundle_id, platform)
-            app_data['Store_Links'] = store_links
-            
-            # Add platform info if not present
-            if 'OS' not in app_data and platform:
-                app_data['OS'] = platform.upper()
-            
+        app_records = sanitize_frame(self.df).to_dict('records')
+        
+        # Store links for every row at once; first non-empty bundle column wins
+        bundle_columns = [
+            'Inventory - App Bundle', 'App Bundle', 'Bundle ID', 'iOS Bundle ID', 
+            'Android Bundle ID', 'Bundle_ID', 'App_Bundle'
+        ]
+        present_bundle_columns = [col for col in bundle_columns if col in self.df.columns]
+        if present_bundle_columns:
+            bundles = self.df[present_bundle_columns].astype(object).bfill(axis=1).iloc[:, 0]
+        else:
+            bundles = pd.Series(None, index=self.df.index, dtype=object)
+        platforms = self.df['OS'] if 'OS' in self.df.columns else pd.Series(None, index=self.df.index, dtype=object)
+        app_store_links, google_play_links = generate_store_link_columns(bundles, platforms)
+        
+        for app_data, app_store, google_play in zip(app_records, app_store_links, google_play_links):
+            app_data['Store_Links'] = {'app_store': app_store, 'google_play': google_play}
             apps_data.append(app_data)
         
         # Category analysis - try different column names and create from app titles
@@ -700,48 +798,20 @@ class MolocoCSVProcessor:
                 break
         
         if category_column:
-            category_stats = self.df.groupby(category_column).agg({
-                'Spend': 'sum' if 'Spend' in self.df.columns else 'count',
-                'Install': 'sum' if 'Install' in self.df.columns else 'count',
-                'Action': 'sum' if 'Action' in self.df.columns else 'count'
-            }).reset_index()
-            category_stats = category_stats.rename(columns={category_column: 'Category'})
-            category_stats['count'] = self.df.groupby(category_column).size().reset_index()[0]
-            categories = category_stats.to_dict('records')
+            category_stats = group_sum_count(self.df, category_column, ['Spend', 'Install', 'Action'], 'Category')
+            categories = sanitize_frame(category_stats).to_dict('records')
             print(f"✅ Processed {len(categories)} categories")
         else:
             print("⚠️ No category column found, creating from app titles")
             # Create categories from app titles
             if 'Inventory - App Title' in self.df.columns:
-                app_categories = self.df.groupby('Inventory - App Title').agg({
-                    'Spend': 'sum' if 'Spend' in self.df.columns else 'count',
-                    'Install': 'sum' if 'Install' in self.df.columns else 'count',
-                    'Action': 'sum' if 'Action' in self.df.columns else 'count'
-                }).reset_index()
-                app_categories = app_categories.rename(columns={'Inventory - App Title': 'Category'})
-                app_categories['count'] = self.df.groupby('Inventory - App Title').size().reset_index()[0]
-                categories = app_categories.to_dict('records')
+                app_categories = group_sum_count(self.df, 'Inventory - App Title', ['Spend', 'Install', 'Action'], 'Category')
+                categories = sanitize_frame(app_categories).to_dict('records')
                 print(f"✅ Created {len(categories)} categories from app titles")
             else:
                 print("⚠️ No app title column found, creating default")
                 categories = [{'Category': 'Unknown', 'Spend': total_spend, 'count': len(apps_data)}]
         
-        # Clean all data to remove NaN values
-        def clean_nan_values(obj):
-            if isinstance(obj, dict):
-                return {k: clean_nan_values(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [clean_nan_values(item) for item in obj]
-            elif isinstance(obj, float) and (pd.isna(obj) or np.isinf(obj)):
-                return 0.0
-            else:
-                return obj
-        
-        # Calculate metrics for inventory
-        total_actions = int(self.df['Action'].sum()) if 'Action' in self.df.columns else 0
-        total_clicks = int(self.df['Click'].sum()) if 'Click' in self.df.columns else 0
-        avg_ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
-        
         result = {
             'overview': {
                 'total_spend': total_spend,
@@ -770,7 +840,12 @@ class MolocoCSVProcessor:
             }
         }
         
-        return clean_nan_values(result)
+        # Frames were sanitized before to_dict, only plain scalar leaves remain
+        result['overview'] = {k: clean_nan_value(v) for k, v in result['overview'].items()}
+        result['daily_breakdown'] = [
+            {k: clean_nan_value(v) for k, v in day.items()} for day in daily_breakdown
+        ]
+        return result
     
     def process_data(self) -> Dict[str, Any]:
         """Main processing method"""
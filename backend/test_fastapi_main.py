@@ -0,0 +1,51 @@
+"""
+Regression tests for fastapi_main (run: python -m unittest from backend/)
+"""
+import asyncio
+import importlib
+import os
+import shutil
+import tempfile
+import unittest
+
+class BatchRequestsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # fastapi_main creates and scans uploads/ relative to the working directory on import
+        cls.cwd = os.getcwd()
+        cls.workdir = tempfile.mkdtemp()
+        os.chdir(cls.workdir)
+        cls.main = importlib.import_module('fastapi_main')
+
+    @classmethod
+    def tearDownClass(cls):
+        os.chdir(cls.cwd)
+        shutil.rmtree(cls.workdir)
+
+    def batch(self, *requests) -> dict:
+        result = asyncio.run(self.main.batch_requests({'requests': list(requests)}))
+        return {response['id']: response for response in result['responses']}
+
+    def test_query_values_are_cast_to_annotated_types(self):
+        responses = self.batch({'id': 'c', 'url': '/creatives?page=2&per_page=5&unknown=1'})
+        self.assertEqual(responses['c']['status'], 200)
+        pagination = responses['c']['body']['pagination']
+        self.assertEqual((pagination['page'], pagination['per_page']), (2, 5))
+
+    def test_string_parameters_are_passed_through(self):
+        responses = self.batch({'id': 'f', 'url': '/reports/filtered?start_date=2025-08-01&country=us'})
+        self.assertEqual(responses['f']['status'], 200)
+        self.assertEqual(responses['f']['body']['filters']['start_date'], '2025-08-01')
+
+    def test_error_mapping(self):
+        responses = self.batch(
+            {'id': 'bad-int', 'url': '/creatives?page=x'},
+            {'id': 'unknown', 'url': '/nope'},
+            {'id': 'post', 'method': 'POST', 'url': '/reports'},
+        )
+        self.assertEqual(responses['bad-int']['status'], 422)
+        self.assertEqual(responses['unknown']['status'], 404)
+        self.assertEqual(responses['post']['status'], 405)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Regression tests for moloco_processor (run: python -m unittest from backend/)
+"""
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from moloco_processor import (
+    MolocoCSVProcessor, downcast_integer_columns, generate_store_links,
+    generate_store_link_columns, group_sum_count
+)
+
+REPORT_WITH_BLANKS = (
+    "Date,Campaign,Creative,Exchange,Countries,Spend,Impressions,Install,Click\n"
+    "2025-08-01,slots_us,cr_1,UNITY,US,10.5,100,2,5\n"
+    "2025-08-02,slots_gb,cr_2,UNITY,GB,3.0,,1,\n"
+)
+
+class LoadReportsCSVTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(REPORT_WITH_BLANKS)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_blank_numeric_cells(self):
+        processor = MolocoCSVProcessor()
+        result = processor.load_and_detect_type(self.path)
+        self.assertTrue(result['success'], result.get('error'))
+        self.assertEqual(result['type'], 'reports')
+        self.assertEqual(processor.df['Date'].tolist(), ['2025-08-01', '2025-08-02'])
+
+        overview = processor.process_data()['overview']
+        self.assertEqual(overview['total_impressions'], 100)
+        self.assertEqual(overview['total_clicks'], 5)
+        self.assertEqual(overview['total_installs'], 3)
+
+class DowncastIntegerColumnsTest(unittest.TestCase):
+    def test_only_count_columns_are_narrowed(self):
+        df = downcast_integer_columns(pd.DataFrame({
+            'Spend': [1, 2], 'D1 Revenue': [0, 3], 'Impressions': [100, 200], 'Campaign': ['a', 'b']
+        }))
+        self.assertEqual(df['Spend'].dtype, np.int64)
+        self.assertEqual(df['D1 Revenue'].dtype, np.int64)
+        self.assertEqual(df['Impressions'].dtype, np.int16)
+
+class StoreLinkColumnsTest(unittest.TestCase):
+    """generate_store_link_columns against the per-row generate_store_links loop it replaced"""
+    
+    BUNDLES = [
+        '123456789', ' 987654 ', 'id123456789', 'idle.game', 'com.foo.bar', 'org.x', 'net.x.y',
+        'com.7games.slots', 'mygame', 'app42', '', '   ', None, np.nan
+    ]
+    
+    def assert_matches_row_wise(self, bundles: pd.Series, platforms: pd.Series):
+        app_store, google_play = generate_store_link_columns(bundles, platforms)
+        for i, (bundle, os_value) in enumerate(zip(bundles, platforms)):
+            # As the old iterrows loop: first non-NaN bundle stripped, OS lowercased or None
+            bundle_id = None if pd.isna(bundle) else str(bundle).strip()
+            platform = None if pd.isna(os_value) else os_value.lower()
+            expected = generate_store_links(bundle_id, platform)
+            self.assertEqual((app_store[i], google_play[i]), (expected['app_store'], expected['google_play']),
+                             f"bundle={bundle!r} os={os_value!r}")
+    
+    def test_with_os_column(self):
+        for os_value in ['IOS', 'ANDROID', 'Android', '', None, np.nan]:
+            bundles = pd.Series(self.BUNDLES, dtype=object)
+            self.assert_matches_row_wise(bundles, pd.Series([os_value] * len(bundles), dtype=object))
+    
+    def test_mixed_os_values(self):
+        bundles = pd.Series(self.BUNDLES, dtype=object)
+        platforms = pd.Series((['IOS', 'ANDROID', None] * len(bundles))[:len(bundles)], dtype=object)
+        self.assert_matches_row_wise(bundles, platforms)
+    
+    def test_missing_os_column(self):
+        bundles = pd.Series(self.BUNDLES, dtype=object)
+        # process_inventory_csv passes an all-None series when there is no OS column
+        self.assert_matches_row_wise(bundles, pd.Series(None, index=bundles.index, dtype=object))
+
+class GroupSumCountTest(unittest.TestCase):
+    """group_sum_count against the groupby().agg() + groupby().size() pair it replaced"""
+    
+    def row_wise(self, df: pd.DataFrame, key: str, columns: list, key_name: str) -> pd.DataFrame:
+        stats = df.groupby(key).agg({
+            col: 'sum' if col in df.columns else 'count' for col in columns
+        }).reset_index()
+        stats = stats.rename(columns={key: key_name})
+        stats['count'] = df.groupby(key).size().reset_index()[0]
+        return stats
+    
+    def assert_matches(self, df: pd.DataFrame, columns: list):
+        expected = self.row_wise(df, 'Category', columns, 'Category')
+        result = group_sum_count(df, 'Category', columns, 'Category')
+        self.assertEqual(list(result.columns), list(expected.columns))
+        self.assertEqual(result['Category'].tolist(), expected['Category'].tolist())
+        for col in columns + ['count']:
+            np.testing.assert_allclose(result[col].to_numpy(dtype=float), expected[col].to_numpy(dtype=float))
+            self.assertEqual(pd.api.types.is_integer_dtype(result[col]), pd.api.types.is_integer_dtype(expected[col]), col)
+    
+    def test_sums_and_counts(self):
+        df = pd.DataFrame({
+            'Category': ['Casino', 'Puzzle', 'Casino', 'Arcade', 'Puzzle', 'Casino'],
+            'Spend': [1.5, 2.25, 0.1, 7.0, np.nan, 3.0],
+            'Install': [1, 0, 3, 2, 5, 1],
+            'Action': [0, 1, 1, 0, 2, 4]
+        })
+        self.assert_matches(df, ['Spend', 'Install', 'Action'])
+    
+    def test_nan_keys_are_dropped(self):
+        df = pd.DataFrame({
+            'Category': ['Casino', np.nan, 'Casino', None, 'Arcade'],
+            'Spend': [1.0, 2.0, 3.0, 4.0, 5.0],
+            'Install': [1, 2, 3, 4, 5],
+            'Action': [1, 1, 1, 1, 1]
+        })
+        self.assert_matches(df, ['Spend', 'Install', 'Action'])
+    
+    def test_missing_columns_count_rows(self):
+        # The old 'count' fallback named columns groupby could not select (KeyError), so the
+        # reference here is the intended behavior: the row count per key
+        df = pd.DataFrame({'Category': ['b', 'a', 'b', np.nan], 'Spend': [1.0, 2.0, 3.0, 4.0]})
+        result = group_sum_count(df, 'Category', ['Spend', 'Install', 'Action'], 'Category')
+        self.assertEqual(result['Category'].tolist(), ['a', 'b'])
+        self.assertEqual(result['Spend'].tolist(), [2.0, 4.0])
+        self.assertEqual(result['Install'].tolist(), [1, 2])
+        self.assertEqual(result['Action'].tolist(), [1, 2])
+        self.assertEqual(result['count'].tolist(), [1, 2])
+
+if __name__ == '__main__':
+    unittest.main()